@@ -1,11 +1,20 @@
 import os
+import queue
+import shutil
+import tempfile
+import threading
 import zipfile
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from tkinter import ttk
-from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 
+# ~(^-^)~ fcntl is POSIX-only; needed for FICLONE reflinks
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 # ~(^-^)~ Pillow for images
 from PIL import Image
 
@@ -51,19 +60,151 @@ logging.basicConfig(
 )
 
 
+# ~(^-^)~ ioctl number for FICLONE (Linux: btrfs, XFS, bcachefs, ...)
+FICLONE = 0x40049409
+
+# ~(^-^)~ How many upcoming files the pipeline warms up ahead of the cleaners
+READ_AHEAD = 16
+
+# ~(^-^)~ Background threads warming the page cache for queued files
+PREFETCH_WORKERS = 4
+
+# ~(^-^)~ Chunk size for background reads when posix_fadvise is unavailable
+PREFETCH_CHUNK = 1024 * 1024
+
+# ~(^-^)~ Core properties cleared by the Office handlers
+DOCX_METADATA_FIELDS = [
+    'author', 'comments', 'category', 'content_status',
+    'identifier', 'keywords', 'language', 'last_modified_by',
+    'last_printed', 'revision', 'subject', 'title', 'version'
+]
+XLSX_METADATA_FIELDS = [
+    'creator', 'title', 'subject', 'description',
+    'keywords', 'category', 'comments', 'last_modified_by',
+    'company', 'manager'
+]
+PPTX_METADATA_FIELDS = [
+    'author', 'category', 'comments', 'content_status', 'created',
+    'identifier', 'keywords', 'last_modified_by', 'last_printed',
+    'modified', 'revision', 'subject', 'title'
+]
+
+
+################################################################
+# ~(^-^)~ OUTPUT TREE HELPERS (out-of-place mode)
+################################################################
+
+def clone_file(src_path, dst_path, allow_hardlink=True):
+    """
+    Place an untouched copy of src_path at dst_path as cheaply as possible:
+    FICLONE reflink -> hardlink -> copy_file_range -> plain copy.
+    Returns the method used. Hardlinks share the inode with the original,
+    so never run in-place cleaning on the output tree afterwards.
+    (っ˘ω˘ς)
+    """
+    os.makedirs(os.path.dirname(dst_path) or ".", exist_ok=True)
+    if os.path.lexists(dst_path):
+        os.remove(dst_path)
+
+    # ~(^-^)~ Reflink: shares extents copy-on-write, no data is read
+    if fcntl is not None:
+        with open(src_path, 'rb') as src:
+            try:
+                with open(dst_path, 'wb') as dst:
+                    fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                return "reflink"
+            except OSError:
+                if os.path.exists(dst_path):
+                    os.remove(dst_path)
+
+    # ~(^-^)~ Hardlink: only valid if nobody writes to dst_path later
+    if allow_hardlink:
+        try:
+            os.link(src_path, dst_path)
+            return "hardlink"
+        except OSError:
+            pass
+
+    # ~(^-^)~ In-kernel copy, falling back to a userspace copy
+    with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+        if hasattr(os, "copy_file_range"):
+            try:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                return "copy_file_range"
+            except OSError:
+                src.seek(0)
+                dst.seek(0)
+                dst.truncate()
+        shutil.copyfileobj(src, dst)
+    return "copy"
+
+
+def _prepare_output(file_path, output_path):
+    """
+    Resolve where a handler should write: in place when output_path is None,
+    otherwise into output_path (creating its parent directories). An existing
+    output_path is unlinked first, so a hardlink to the original is never
+    truncated through the shared inode.
+    """
+    if output_path is None or os.path.abspath(output_path) == os.path.abspath(file_path):
+        return file_path
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    if os.path.lexists(output_path):
+        os.remove(output_path)
+    return output_path
+
+
+def _place_unchanged(file_path, output_path, reason):
+    """
+    Put the original into the output tree via clone_file and log why.
+    """
+    method = clone_file(file_path, output_path)
+    logging.info(f"{reason}; placed unchanged ({method}): {file_path}")
+    return True
+
+
+def _write_out_of_place(handler, file_path, output_path):
+    """
+    Run handler into a staging file next to output_path and move it into
+    place only if the handler succeeds, so a failed clean never leaves a
+    partial or still-tagged file in the output tree.
+    """
+    output_dir = os.path.dirname(output_path) or "."
+    os.makedirs(output_dir, exist_ok=True)
+    fd, staging_path = tempfile.mkstemp(dir=output_dir, prefix=".mrt-",
+                                        suffix=os.path.splitext(output_path)[1])
+    os.close(fd)
+    try:
+        if handler(file_path, staging_path):
+            os.replace(staging_path, output_path)
+            return True
+        if os.path.lexists(output_path):
+            os.remove(output_path)
+        return False
+    finally:
+        if os.path.lexists(staging_path):
+            os.remove(staging_path)
+
+
 ################################################################
 # ~(^-^)~ METADATA REMOVAL LOGIC FOR VARIOUS FILE FORMATS
 ################################################################
 
-def remove_metadata_from_zip(zip_path):
+def remove_metadata_from_zip(zip_path, output_path=None):
     """ 
     Unzip -> Remove metadata from each entry -> Re-zip.
     (｡•̀ᴗ-)✧
     """
-    temp_dir = "temp_zip_extract"
+    # ~(^-^)~ Private extraction dir, so parallel archives never collide
+    temp_dir = tempfile.mkdtemp(prefix="temp_zip_extract_")
     try:
         logging.info(f"Processing ZIP: {zip_path}")
-        os.makedirs(temp_dir, exist_ok=True)
+        output_path = _prepare_output(zip_path, output_path)
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
             zip_ref.extractall(temp_dir)
 
@@ -74,40 +215,44 @@ def remove_metadata_from_zip(zip_path):
                 remove_metadata(file_path)
 
         # ~(^-^)~ Repackage as a new, cleaned ZIP
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zip_ref:
+        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zip_ref:
             for root, dirs, files in os.walk(temp_dir):
                 for file in files:
                     file_path = os.path.join(root, file)
                     arc_name = os.path.relpath(file_path, temp_dir)
                     zip_ref.write(file_path, arcname=arc_name)
 
-        # ~(^-^)~ Cleanup
-        for root, dirs, files in os.walk(temp_dir, topdown=False):
-            for name in files:
-                os.remove(os.path.join(root, name))
-            for name in dirs:
-                os.rmdir(os.path.join(root, name))
-        os.rmdir(temp_dir)
-
         return True
     except Exception as e:
         logging.exception(f"Error processing ZIP {zip_path}: {e}")
         return False
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
 
 
-def remove_exif_jpeg(file_path):
+def remove_exif_jpeg(file_path, output_path=None):
     """ 
     Strip EXIF from JPEG without re-encoding 
     ヾ(⌐■_■)ノ♪
     """
     try:
         logging.info(f"Stripping EXIF from JPEG: {file_path}")
-        piexif.remove(file_path)
+        if output_path is None:
+            piexif.remove(file_path)
+            output_path = file_path
+        else:
+            with open(file_path, 'rb') as f:
+                jpeg_data = f.read()
+            exif_dict = piexif.load(jpeg_data)
+            if not any(exif_dict[tag] for tag in ["0th", "Exif", "GPS", "1st"]):
+                return _place_unchanged(file_path, output_path, "JPEG has no EXIF")
+            output_path = _prepare_output(file_path, output_path)
+            piexif.remove(jpeg_data, output_path)
         # Verify removal
-        exif_dict = piexif.load(file_path)
+        exif_dict = piexif.load(output_path)
         if any(exif_dict[tag] for tag in ["0th", "Exif", "GPS", "1st"]):
             logging.info(f"EXIF still present after piexif.remove. Re-encoding: {file_path}")
-            _reencode_jpeg(file_path)
+            _reencode_jpeg(output_path)
         else:
             logging.info(f"EXIF successfully removed: {file_path}")
         return True
@@ -115,45 +260,45 @@ def remove_exif_jpeg(file_path):
         logging.exception(f"Error processing JPEG EXIF {file_path}: {e}")
         # Fallback to re-encode if piexif fails
         try:
-            _reencode_jpeg(file_path)
+            _reencode_jpeg(file_path, output_path)
             return True
         except Exception as ex:
             logging.exception(f"Failed to re-encode JPEG: {file_path}, error: {ex}")
             return False
 
 
-def _reencode_jpeg(file_path):
+def _reencode_jpeg(file_path, output_path=None):
     """
     Re-encode the JPEG with Pillow. This definitely strips EXIF,
     but may alter quality/size if not configured carefully.
     """
     try:
+        output_path = _prepare_output(file_path, output_path)
         with Image.open(file_path) as img:
             # Convert to RGB (some images might be in different modes)
             rgb_img = img.convert("RGB")
             # Save, forcing 'exif' to be blank
-            rgb_img.save(file_path, format='JPEG', exif=b'')
+            rgb_img.save(output_path, format='JPEG', exif=b'')
         logging.info(f"Re-encoded JPEG to remove residual EXIF: {file_path}")
     except Exception as e:
         logging.exception(f"Failed to re-encode JPEG: {file_path}, error: {e}")
         raise
 
 
-def remove_metadata_from_jpeg(file_path):
+def remove_metadata_from_jpeg(file_path, output_path=None):
     """
     Attempt to remove EXIF from JPEG using piexif (no re-encoding).
     If EXIF still remains, fallback to re-encoding with Pillow to ensure
     all metadata is stripped. This may alter quality/file size slightly.
     """
     try:
-        remove_exif_jpeg(file_path)
-        return True
+        return remove_exif_jpeg(file_path, output_path)
     except Exception as e:
         logging.error(f"Failed to remove metadata from JPEG {file_path}: {e}")
         return False
 
 
-def remove_metadata_from_image(image_path):
+def remove_metadata_from_image(image_path, output_path=None):
     """
     Images beyond JPEG (PNG, GIF, BMP, TIFF):
     Re-encode with Pillow to drop metadata.
@@ -161,15 +306,16 @@ def remove_metadata_from_image(image_path):
     """
     ext = os.path.splitext(image_path)[1].lower()
     if ext in [".jpg", ".jpeg"]:
-        return remove_metadata_from_jpeg(image_path)
+        return remove_metadata_from_jpeg(image_path, output_path)
     try:
         logging.info(f"Processing image: {image_path}")
+        output_path = _prepare_output(image_path, output_path)
         with Image.open(image_path) as img:
             data = list(img.getdata())
             clean_img = Image.new(img.mode, img.size)
             clean_img.putdata(data)
             # Keep the original format if possible
-            clean_img.save(image_path, format=img.format)
+            clean_img.save(output_path, format=img.format)
         logging.info(f"Metadata removed from image: {image_path}")
         return True
     except Exception as e:
@@ -177,7 +323,7 @@ def remove_metadata_from_image(image_path):
         return False
 
 
-def remove_metadata_from_pdf(pdf_path):
+def remove_metadata_from_pdf(pdf_path, output_path=None):
     """
     PDF: Read pages, rewrite them, omit doc info. 
     (／・ω・)／
@@ -185,10 +331,14 @@ def remove_metadata_from_pdf(pdf_path):
     try:
         logging.info(f"Processing PDF: {pdf_path}")
         reader = PdfReader(pdf_path)
+        if output_path is not None and "/Info" not in reader.trailer \
+                and "/Metadata" not in reader.trailer["/Root"]:
+            return _place_unchanged(pdf_path, output_path, "PDF has no document info")
+        output_path = _prepare_output(pdf_path, output_path)
         writer = PdfWriter()
         for page in reader.pages:
             writer.add_page(page)
-        with open(pdf_path, 'wb') as out_pdf:
+        with open(output_path, 'wb') as out_pdf:
             writer.write(out_pdf)
         logging.info(f"Metadata removed from PDF: {pdf_path}")
         return True
@@ -197,7 +347,7 @@ def remove_metadata_from_pdf(pdf_path):
         return False
 
 
-def remove_metadata_from_docx(docx_path):
+def remove_metadata_from_docx(docx_path, output_path=None):
     """
     DOCX: Clear core properties with python-docx.
     (ﾉ´ヮ´)ﾉ*:･ﾟ✧
@@ -205,18 +355,19 @@ def remove_metadata_from_docx(docx_path):
     try:
         logging.info(f"Processing DOCX: {docx_path}")
         doc = Document(docx_path)
-        metadata_fields = [
-            'author', 'comments', 'category', 'content_status',
-            'identifier', 'keywords', 'language', 'last_modified_by',
-            'last_printed', 'revision', 'subject', 'title', 'version'
-        ]
-        for prop in metadata_fields:
+        # Only string fields count: dates/revision can't be blanked below either
+        if output_path is not None and not any(
+                isinstance(getattr(doc.core_properties, prop, None), str) and getattr(doc.core_properties, prop)
+                for prop in DOCX_METADATA_FIELDS):
+            return _place_unchanged(docx_path, output_path, "DOCX core properties already empty")
+        output_path = _prepare_output(docx_path, output_path)
+        for prop in DOCX_METADATA_FIELDS:
             try:
                 setattr(doc.core_properties, prop, "")
             except ValueError:
                 pass
         doc.settings.odd_and_even_pages_header_footer = False
-        doc.save(docx_path)
+        doc.save(output_path)
         logging.info(f"Metadata removed from DOCX: {docx_path}")
         return True
     except Exception as e:
@@ -224,7 +375,7 @@ def remove_metadata_from_docx(docx_path):
         return False
 
 
-def remove_metadata_from_pptx(pptx_path):
+def remove_metadata_from_pptx(pptx_path, output_path=None):
     """
     PPTX: Clear core properties with python-pptx.
     ヾ(*ΦωΦ)ツ
@@ -236,6 +387,9 @@ def remove_metadata_from_pptx(pptx_path):
         logging.info(f"Processing PPTX: {pptx_path}")
         ppt = Presentation(pptx_path)
         props = ppt.core_properties
+        if output_path is not None and not any(getattr(props, prop, None) for prop in PPTX_METADATA_FIELDS):
+            return _place_unchanged(pptx_path, output_path, "PPTX core properties already empty")
+        output_path = _prepare_output(pptx_path, output_path)
         # ~(^-^)~ Clear 'em all
         props.author = ""
         props.category = ""
@@ -250,7 +404,7 @@ def remove_metadata_from_pptx(pptx_path):
         props.revision = ""
         props.subject = ""
         props.title = ""
-        ppt.save(pptx_path)
+        ppt.save(output_path)
         logging.info(f"Metadata removed from PPTX: {pptx_path}")
         return True
     except Exception as e:
@@ -258,7 +412,7 @@ def remove_metadata_from_pptx(pptx_path):
         return False
 
 
-def remove_metadata_from_ppt(ppt_path):
+def remove_metadata_from_ppt(ppt_path, output_path=None):
     """
     PPT (legacy):
     Typically convert .ppt -> .pptx, then do the PPTX route.
@@ -272,7 +426,7 @@ def remove_metadata_from_ppt(ppt_path):
         return False
 
 
-def remove_metadata_from_odt(odt_path):
+def remove_metadata_from_odt(odt_path, output_path=None):
     """
     ODT (OpenDocument Text): Use odfpy to remove <office:meta>.
     (ˆ-ˆ)و♪
@@ -282,12 +436,13 @@ def remove_metadata_from_odt(odt_path):
         return False
     try:
         logging.info(f"Processing ODT: {odt_path}")
+        output_path = _prepare_output(odt_path, output_path)
         doc = odf_load(odt_path)
         meta = doc.meta
         # ~(^-^)~ Remove all metadata children
         for child in list(meta.childNodes):
             meta.removeChild(child)
-        doc.save(odt_path)
+        doc.save(output_path)
         logging.info(f"Metadata removed from ODT: {odt_path}")
         return True
     except Exception as e:
@@ -295,7 +450,7 @@ def remove_metadata_from_odt(odt_path):
         return False
 
 
-def remove_metadata_from_ods(ods_path):
+def remove_metadata_from_ods(ods_path, output_path=None):
     """
     ODS (OpenDocument Spreadsheet): Also via odfpy.
     (☞ﾟヮﾟ)☞
@@ -305,11 +460,12 @@ def remove_metadata_from_ods(ods_path):
         return False
     try:
         logging.info(f"Processing ODS: {ods_path}")
+        output_path = _prepare_output(ods_path, output_path)
         spreadsheet = odf_load(ods_path)
         meta = spreadsheet.meta
         for child in list(meta.childNodes):
             meta.removeChild(child)
-        spreadsheet.save(ods_path)
+        spreadsheet.save(output_path)
         logging.info(f"Metadata removed from ODS: {ods_path}")
         return True
     except Exception as e:
@@ -317,15 +473,15 @@ def remove_metadata_from_ods(ods_path):
         return False
 
 
-def remove_metadata_from_epub(epub_path):
+def remove_metadata_from_epub(epub_path, output_path=None):
     """
     EPUB: Search for .opf files, remove <metadata> content.
     ヾ(〃^∇^)ﾉ
     """
-    temp_dir = "temp_epub_extract"
+    temp_dir = tempfile.mkdtemp(prefix="temp_epub_extract_")
     try:
         logging.info(f"Processing EPUB: {epub_path}")
-        os.makedirs(temp_dir, exist_ok=True)
+        output_path = _prepare_output(epub_path, output_path)
         with zipfile.ZipFile(epub_path, 'r') as zip_ref:
             zip_ref.extractall(temp_dir)
 
@@ -351,7 +507,7 @@ def remove_metadata_from_epub(epub_path):
                 logging.error(f"Could not strip metadata from {opf_file}: {ex}")
 
         # ~(^-^)~ Re-zip
-        with zipfile.ZipFile(epub_path, 'w', zipfile.ZIP_DEFLATED) as zip_ref:
+        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zip_ref:
             for root, dirs, files in os.walk(temp_dir):
                 for file in files:
                     file_path = os.path.join(root, file)
@@ -359,33 +515,28 @@ def remove_metadata_from_epub(epub_path):
                     zip_ref.write(file_path, arcname)
         logging.info(f"Re-zipped EPUB after metadata removal: {epub_path}")
 
-        # ~(^-^)~ Cleanup
-        for root, dirs, files in os.walk(temp_dir, topdown=False):
-            for name in files:
-                os.remove(os.path.join(root, name))
-            for name in dirs:
-                os.rmdir(os.path.join(root, name))
-        os.rmdir(temp_dir)
-
         return True
     except Exception as e:
         logging.exception(f"Error processing EPUB {epub_path}: {e}")
         return False
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
 
 
-def remove_metadata_from_rtf(rtf_path):
+def remove_metadata_from_rtf(rtf_path, output_path=None):
     r"""
     RTF: Naive \info removal with regex.
     (ﾉ´ヮ´)ﾉ*:･ﾟ✧
     """
     try:
         logging.info(f"Processing RTF: {rtf_path}")
+        output_path = _prepare_output(rtf_path, output_path)
         with open(rtf_path, 'r', encoding='utf-8', errors='ignore') as f:
             content = f.read()
         import re
         # Remove {\info ...} blocks
         content = re.sub(r'{\\info[^}]*}', '', content, flags=re.DOTALL)
-        with open(rtf_path, 'w', encoding='utf-8') as f:
+        with open(output_path, 'w', encoding='utf-8') as f:
             f.write(content)
         logging.info(f"Metadata removed from RTF: {rtf_path}")
         return True
@@ -394,13 +545,17 @@ def remove_metadata_from_rtf(rtf_path):
         return False
 
 
-def remove_metadata_from_mp3(mp3_path):
+def remove_metadata_from_mp3(mp3_path, output_path=None):
     """ 
     MP3: Delete ID3 tags with mutagen.
+    mutagen edits in place, so out-of-place mode clones first (never hardlinks).
     (＾▽＾) 
     """
     try:
         logging.info(f"Processing MP3: {mp3_path}")
+        if output_path is not None:
+            clone_file(mp3_path, output_path, allow_hardlink=False)
+            mp3_path = output_path
         audio = MP3(mp3_path, ID3=ID3)
         audio.delete()
         audio.save(mp3_path)
@@ -420,13 +575,17 @@ def remove_metadata_from_mp3(mp3_path):
         return False
 
 
-def remove_metadata_from_flac(flac_path):
+def remove_metadata_from_flac(flac_path, output_path=None):
     """ 
     FLAC: Remove tags with mutagen.
+    mutagen edits in place, so out-of-place mode clones first (never hardlinks).
     (｡•̀ᴗ-)✧
     """
     try:
         logging.info(f"Processing FLAC: {flac_path}")
+        if output_path is not None:
+            clone_file(flac_path, output_path, allow_hardlink=False)
+            flac_path = output_path
         audio = FLAC(flac_path)
         audio.delete()
         audio.save()
@@ -437,7 +596,7 @@ def remove_metadata_from_flac(flac_path):
         return False
 
 
-def remove_metadata_from_xlsx(xlsx_path):
+def remove_metadata_from_xlsx(xlsx_path, output_path=None):
     """
     XLSX: Clear workbook properties with openpyxl.
     (∿°○°)∿
@@ -445,17 +604,16 @@ def remove_metadata_from_xlsx(xlsx_path):
     try:
         logging.info(f"Processing XLSX: {xlsx_path}")
         workbook = load_workbook(filename=xlsx_path)
-        metadata_fields = [
-            'creator', 'title', 'subject', 'description',
-            'keywords', 'category', 'comments', 'last_modified_by',
-            'company', 'manager'
-        ]
-        for prop in metadata_fields:
+        if output_path is not None and not any(
+                getattr(workbook.properties, prop, None) for prop in XLSX_METADATA_FIELDS):
+            return _place_unchanged(xlsx_path, output_path, "XLSX properties already empty")
+        output_path = _prepare_output(xlsx_path, output_path)
+        for prop in XLSX_METADATA_FIELDS:
             try:
                 setattr(workbook.properties, prop, "")
             except ValueError:
                 pass
-        workbook.save(xlsx_path)
+        workbook.save(output_path)
         logging.info(f"Metadata removed from XLSX: {xlsx_path}")
         return True
     except Exception as e:
@@ -467,64 +625,300 @@ def remove_metadata_from_xlsx(xlsx_path):
 # ~(^-^)~ MASTER SWITCH: Determine file type + call appropriate remover
 ################################################################
 
-def remove_metadata(file_path):
+METADATA_HANDLERS = {
+    # ~(^-^)~ Images
+    '.jpg': remove_metadata_from_image,
+    '.jpeg': remove_metadata_from_image,
+    '.png': remove_metadata_from_image,
+    '.gif': remove_metadata_from_image,
+    '.bmp': remove_metadata_from_image,
+    '.tiff': remove_metadata_from_image,
+    # ~(^-^)~ Documents
+    '.pdf': remove_metadata_from_pdf,
+    '.docx': remove_metadata_from_docx,
+    '.xlsx': remove_metadata_from_xlsx,
+    '.pptx': remove_metadata_from_pptx,
+    '.ppt': remove_metadata_from_ppt,
+    '.odt': remove_metadata_from_odt,
+    '.ods': remove_metadata_from_ods,
+    '.epub': remove_metadata_from_epub,
+    '.rtf': remove_metadata_from_rtf,
+    # ~(^-^)~ Audio
+    '.mp3': remove_metadata_from_mp3,
+    '.flac': remove_metadata_from_flac,
+    # ~(^-^)~ Archives
+    '.zip': remove_metadata_from_zip,
+}
+
+# ~(^-^)~ Extensions whose handler can actually clean the file here:
+# legacy .ppt never can, PPTX/ODF need their optional libs
+CLEANABLE_EXTENSIONS = {
+    ext for ext in METADATA_HANDLERS
+    if ext != '.ppt'
+    and (CAN_HANDLE_PPTX or ext != '.pptx')
+    and (CAN_HANDLE_ODF or ext not in ('.odt', '.ods'))
+}
+
+
+def remove_metadata(file_path, output_path=None):
     """ 
     Decide how to remove metadata based on file extension. 
+    With output_path set, the source is left untouched and the cleaned
+    file is written to output_path instead; files that cannot be cleaned
+    here are placed there unchanged so the mirror stays complete.
     (ﾉ◕ヮ◕)ﾉ*:･ﾟ✧
     """
     file_extension = os.path.splitext(file_path)[1].lower()
+    handler = METADATA_HANDLERS.get(file_extension)
 
-    # ~(^-^)~ Images
-    if file_extension in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff']:
-        return remove_metadata_from_image(file_path)
-
-    # ~(^-^)~ PDFs
-    elif file_extension == '.pdf':
-        return remove_metadata_from_pdf(file_path)
-
-    # ~(^-^)~ DOCX
-    elif file_extension == '.docx':
-        return remove_metadata_from_docx(file_path)
-
-    # ~(^-^)~ MP3 / FLAC
-    elif file_extension == '.mp3':
-        return remove_metadata_from_mp3(file_path)
-    elif file_extension == '.flac':
-        return remove_metadata_from_flac(file_path)
-
-    # ~(^-^)~ XLSX
-    elif file_extension == '.xlsx':
-        return remove_metadata_from_xlsx(file_path)
-
-    # ~(^-^)~ ZIP
-    elif file_extension == '.zip':
-        return remove_metadata_from_zip(file_path)
-
-    # ~(^-^)~ PPTX / PPT
-    elif file_extension == '.pptx':
-        return remove_metadata_from_pptx(file_path)
-    elif file_extension == '.ppt':
-        return remove_metadata_from_ppt(file_path)
-
-    # ~(^-^)~ ODT / ODS
-    elif file_extension == '.odt':
-        return remove_metadata_from_odt(file_path)
-    elif file_extension == '.ods':
-        return remove_metadata_from_ods(file_path)
-
-    # ~(^-^)~ EPUB
-    elif file_extension == '.epub':
-        return remove_metadata_from_epub(file_path)
-
-    # ~(^-^)~ RTF
-    elif file_extension == '.rtf':
-        return remove_metadata_from_rtf(file_path)
-
-    else:
-        logging.warning(f"Unsupported file type {file_extension} for {file_path}.")
+    if output_path is None:
+        if handler is None:
+            logging.warning(f"Unsupported file type {file_extension} for {file_path}.")
+            return False
+        return handler(file_path)
+
+    # ~(^-^)~ Out-of-place mode
+    try:
+        if file_extension in CLEANABLE_EXTENSIONS:
+            return _write_out_of_place(handler, file_path, output_path)
+        if handler is not None:
+            logging.warning(f"No usable handler for {file_extension}; metadata NOT removed from {file_path}")
+        return _place_unchanged(file_path, output_path, f"Unsupported file type {file_extension}")
+    except Exception as e:
+        logging.exception(f"Error placing {file_path} into output tree: {e}")
         return False
 
 
+################################################################
+# ~(^-^)~ READ-AHEAD PIPELINE: prefetch -> clean -> report
+################################################################
+
+def sort_for_locality(file_paths):
+    """
+    Order arbitrary file paths by directory and inode so reads sweep the
+    disk instead of seeking back and forth.
+    """
+    def locality_key(path):
+        try:
+            inode = os.stat(path).st_ino
+        except OSError:
+            inode = 0
+        return (os.path.dirname(path), inode, path)
+    return sorted(file_paths, key=locality_key)
+
+
+def prefetch_file(file_path, cancelled=None):
+    """
+    Warm the page cache for file_path: posix_fadvise(WILLNEED) where
+    available, otherwise read it through once and discard the data
+    (stopping early if the cancelled event is set).
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+            else:
+                while not (cancelled is not None and cancelled.is_set()) and f.read(PREFETCH_CHUNK):
+                    pass
+    except OSError as e:
+        # ~(^-^)~ Only a hint; the cleaner will report real failures
+        logging.debug(f"Prefetch skipped for {file_path}: {e}")
+
+
+def run_pipeline(jobs, read_ahead=READ_AHEAD, max_workers=None):
+    """
+    Run remove_metadata over (file_path, output_path) jobs and yield
+    (file_path, result) as each file finishes. A feeder keeps up to
+    read_ahead jobs queued ahead of the cleaner threads and hands each one
+    to a small pool of warmers, which prefetch it unless a cleaner has
+    already picked it up. Both queues are bounded by read_ahead; handlers
+    still write their own output. Only files a handler will read are
+    prefetched, and read_ahead=0 turns prefetching off. All threads have
+    exited by the time the generator finishes or is closed.
+    (ﾉ≧∀≦)ﾉ
+    """
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+    queued = queue.Queue(maxsize=max(read_ahead, 1))
+    to_warm = queue.Queue(maxsize=max(read_ahead, 1))
+    results = queue.Queue(maxsize=max(read_ahead, 1))
+    started = set()
+    started_lock = threading.Lock()
+    stop = threading.Event()
+
+    def put(q, item):
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def get(q):
+        while not stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        return None
+
+    def feeder():
+        for index, job in enumerate(jobs):
+            if not put(queued, (index, job)):
+                return
+            if read_ahead > 0 and os.path.splitext(job[0])[1].lower() in CLEANABLE_EXTENSIONS:
+                try:
+                    to_warm.put_nowait((index, job[0]))
+                except queue.Full:
+                    # ~(^-^)~ Warmers are behind; this one is simply read cold
+                    pass
+        for _ in range(max_workers):
+            put(queued, None)
+
+    def warmer():
+        while True:
+            item = get(to_warm)
+            if item is None:
+                return
+            index, file_path = item
+            with started_lock:
+                if index in started:
+                    continue
+            prefetch_file(file_path, stop)
+
+    def cleaner():
+        while True:
+            item = get(queued)
+            if item is None:
+                put(results, None)
+                return
+            index, (file_path, output_path) = item
+            with started_lock:
+                started.add(index)
+            try:
+                result = remove_metadata(file_path, output_path)
+            except Exception as e:
+                logging.exception(f"Unexpected error processing {file_path}: {e}")
+                result = False
+            put(results, (file_path, result))
+
+    threads = [threading.Thread(target=feeder, daemon=True)]
+    if read_ahead > 0:
+        threads += [threading.Thread(target=warmer, daemon=True) for _ in range(PREFETCH_WORKERS)]
+    threads += [threading.Thread(target=cleaner, daemon=True) for _ in range(max_workers)]
+    for thread in threads:
+        thread.start()
+
+    try:
+        finished = 0
+        while finished < max_workers:
+            item = results.get()
+            if item is None:
+                finished += 1
+            else:
+                yield item
+    finally:
+        # ~(^-^)~ Drop pending warms and wait, so nothing outlives the run
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+
+################################################################
+# ~(^-^)~ TREE MIRRORING (out-of-place mode for whole folders)
+################################################################
+
+def scan_tree(source_dir):
+    """
+    List every regular file and directory below source_dir with os.scandir.
+    Files come back ordered by directory and inode for on-disk locality.
+    Symlinks and special files are neither followed nor mirrored; each one
+    is logged so a mirror is never silently incomplete.
+    (ノ°∀°)ノ
+    """
+    found = []
+    dir_paths = []
+    pending = [source_dir]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_symlink():
+                        logging.warning(f"Skipping symlink: {entry.path}")
+                    elif entry.is_dir():
+                        dir_paths.append(entry.path)
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        found.append((current, entry.inode(), entry.path))
+                    else:
+                        logging.warning(f"Skipping special file: {entry.path}")
+        except OSError as e:
+            logging.error(f"Could not scan directory {current}: {e}")
+    found.sort()
+    dir_paths.sort()
+    return [path for _, _, path in found], dir_paths
+
+
+def mirror_output_path(file_path, source_dir, output_dir):
+    """
+    Map a path under source_dir to the same relative path under output_dir.
+    """
+    return os.path.join(output_dir, os.path.relpath(file_path, source_dir))
+
+
+def plan_mirror(source_dir, output_dir):
+    """
+    Validate the two folders and build the mirror plan: a list of
+    (file_path, output_path) jobs in on-disk order, plus every directory
+    to recreate under output_dir. Raises ValueError if the folders are the
+    same or one is nested inside the other.
+    """
+    source_dir = os.path.realpath(source_dir)
+    output_dir = os.path.realpath(output_dir)
+    try:
+        common = os.path.commonpath([source_dir, output_dir])
+    except ValueError:
+        # ~(^-^)~ Different drives on Windows: no overlap possible
+        common = None
+    if common in (source_dir, output_dir):
+        raise ValueError("Source and output directories must not overlap.")
+
+    file_paths, dir_paths = scan_tree(source_dir)
+    jobs = [(fp, mirror_output_path(fp, source_dir, output_dir)) for fp in file_paths]
+    output_dirs = [mirror_output_path(d, source_dir, output_dir) for d in dir_paths]
+    return jobs, output_dirs
+
+
+def mirror_tree(source_dir, output_dir, max_workers=None, read_ahead=READ_AHEAD, progress_callback=None):
+    """
+    Clean a whole directory tree out-of-place into output_dir.
+    Originals are never modified; cleaned files are written straight into
+    the mirror and everything else is reflinked/hardlinked/copied there.
+    progress_callback(completed, total) is called after every file.
+    Returns (successes, total).
+    ＼(^o^)／
+    """
+    jobs, output_dirs = plan_mirror(source_dir, output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    for directory in output_dirs:
+        os.makedirs(directory, exist_ok=True)
+
+    successes = 0
+    completed = 0
+    for file_path, result in run_pipeline(jobs, read_ahead=read_ahead, max_workers=max_workers):
+        completed += 1
+        if result:
+            successes += 1
+        else:
+            logging.error(f"Failed to mirror {file_path}")
+        if progress_callback is not None:
+            progress_callback(completed, len(jobs))
+    logging.info(f"Mirrored {source_dir} -> {output_dir}: {successes}/{len(jobs)} cleaned or placed")
+    return successes, len(jobs)
+
+
 ################################################################
 # ~(^-^)~ GUI / APPLICATION LOGIC
 ################################################################
@@ -551,6 +945,7 @@ class MetadataRemovalApp:
 
         file_menu = tk.Menu(self.menu_bar, tearoff=0)
         file_menu.add_command(label="Open", command=self.select_files)
+        file_menu.add_command(label="Mirror Folder...", command=self.mirror_folder)
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.master.quit)
         self.menu_bar.add_cascade(label="File", menu=file_menu)
@@ -580,8 +975,11 @@ class MetadataRemovalApp:
         self.btn_clear_list = tk.Button(self.button_frame, text="Clear List", command=self.clear_file_list)
         self.btn_clear_list.grid(row=0, column=2, padx=5)
 
+        self.btn_mirror_folder = tk.Button(self.button_frame, text="Mirror Folder", command=self.mirror_folder)
+        self.btn_mirror_folder.grid(row=0, column=3, padx=5)
+
         self.btn_exit = tk.Button(self.button_frame, text="Exit", command=self.master.quit)
-        self.btn_exit.grid(row=0, column=3, padx=5)
+        self.btn_exit.grid(row=0, column=4, padx=5)
 
         # ~(^-^)~ Progress bar
         self.progress = ttk.Progressbar(self.master, orient=tk.HORIZONTAL, length=500, mode='determinate')
@@ -622,7 +1020,8 @@ class MetadataRemovalApp:
 
     def process_files(self):
         """
-        Remove metadata from each file in parallel. 
+        Remove metadata from each file in parallel, prefetching upcoming
+        files while the current ones are cleaned.
         Update progress bar as we go.
         (ﾉ>ω<)ﾉ :｡･::･ﾟ’
         """
@@ -634,27 +1033,22 @@ class MetadataRemovalApp:
         self.progress["value"] = 0
         self.progress["maximum"] = len(self.file_paths)
 
-        def worker(fpath):
-            return (fpath, remove_metadata(fpath))
-
+        # ~(^-^)~ Read-ahead pipeline, walking the files in on-disk order
+        jobs = [(fp, None) for fp in sort_for_locality(self.file_paths)]
         successes = 0
-        with ThreadPoolExecutor() as executor:
-            # ~(^-^)~ Submit tasks
-            future_map = {executor.submit(worker, fp): fp for fp in self.file_paths}
-            completed = 0
-
-            for future in as_completed(future_map):
-                fpath, result = future.result()
-                completed += 1
-                self.progress["value"] = completed
-                self.progress.update_idletasks()
-
-                if result:
-                    successes += 1
-                else:
-                    short_name = os.path.basename(fpath)
-                    messagebox.showerror("Error", f"Failed to remove metadata from {short_name}")
-                    logging.error(f"Failed to remove metadata from {short_name}")
+        completed = 0
+
+        for fpath, result in run_pipeline(jobs):
+            completed += 1
+            self.progress["value"] = completed
+            self.progress.update_idletasks()
+
+            if result:
+                successes += 1
+            else:
+                short_name = os.path.basename(fpath)
+                messagebox.showerror("Error", f"Failed to remove metadata from {short_name}")
+                logging.error(f"Failed to remove metadata from {short_name}")
 
         # ~(^-^)~ Show summary
         if successes == len(self.file_paths):
@@ -667,6 +1061,40 @@ class MetadataRemovalApp:
 
         self.status_label.config(text="Process completed.")
 
+    def mirror_folder(self):
+        """
+        Clean a whole folder into a separate output folder, leaving the
+        originals untouched.
+        (ง •̀_•́)ง
+        """
+        source_dir = filedialog.askdirectory(title="Select source folder")
+        if not source_dir:
+            return
+        output_dir = filedialog.askdirectory(title="Select output folder")
+        if not output_dir:
+            return
+
+        def on_progress(completed, total):
+            self.progress["maximum"] = total
+            self.progress["value"] = completed
+            self.progress.update_idletasks()
+
+        self.status_label.config(text="Mirroring...")
+        self.progress["value"] = 0
+        try:
+            successes, total = mirror_tree(source_dir, output_dir, progress_callback=on_progress)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            self.status_label.config(text="Mirror aborted.")
+            return
+
+        if successes == total:
+            messagebox.showinfo("Success", f"Mirrored {total} file(s) into {output_dir}. (ﾉ◕ヮ◕)ﾉ*:･ﾟ✧")
+        else:
+            messagebox.showinfo("Partial Success",
+                                f"Mirrored {successes} out of {total} files; see metadata_removal.log.")
+        self.status_label.config(text="Mirror completed.")
+
 
 ################################################################
 # ~(^-^)~ MAIN ENTRY POINT